@@ -7,8 +7,30 @@ data structures, error recovery, and custom processing.
 """
 
 import json
+import sys
+import tracemalloc
 from nextjs_hydration_parser import NextJSHydrationDataExtractor
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def pretty_json(data):
+    """Pretty-print data as JSON with a 2-space indent"""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2)
+
+
+# Shared by every example below; parse() keeps no state between calls
+_EXTRACTOR = NextJSHydrationDataExtractor()
+
 
 def complex_data_example():
     """Example with complex nested data structures"""
@@ -20,22 +42,25 @@ def complex_data_example():
     <script>self.__next_f.push([4,"{\\"errors\\":[{\\"field\\":\\"email\\",\\"message\\":\\"Invalid format\\"}],\\"warnings\\":[\\"Deprecated API used\\"]}"])</script>
     """
 
-    extractor = NextJSHydrationDataExtractor()
-    chunks = extractor.parse(html_content)
+    extractor = _EXTRACTOR
+    chunks = extractor.iter_parse(html_content)
 
     print("=== Complex Data Structure Example ===")
 
+    # Collect each chunk's report and write it in one call
     for chunk in chunks:
-        print(f"\nChunk {chunk['chunk_id']}:")
+        lines = [f"\nChunk {chunk['chunk_id']}:"]
         for item in chunk["extracted_data"]:
-            print(f"  Type: {item['type']}")
+            lines.append(f"  Type: {item['type']}")
 
             if isinstance(item["data"], dict):
                 # Pretty print complex structures
-                print("  Data structure:")
-                print(json.dumps(item["data"], indent=4))
+                lines.append("  Data structure:")
+                lines.append(pretty_json(item["data"]))
             else:
-                print(f"  Raw data: {item['data']}")
+                lines.append(f"  Raw data: {item['data']}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def error_handling_example():
@@ -50,8 +75,8 @@ def error_handling_example():
     <script>self.__next_f.push([5,"{\\"recovered\\": \\"data\\", \\"after\\": \\"error\\"}"])</script>
     """
 
-    extractor = NextJSHydrationDataExtractor()
-    chunks = extractor.parse(html_content)
+    extractor = _EXTRACTOR
+    chunks = extractor.iter_parse(html_content)
 
     print("\n=== Error Handling Example ===")
 
@@ -85,23 +110,27 @@ def multi_chunk_assembly_example():
     <script>self.__next_f.push([2,"\\"page\\": 1, \\"hasMore\\": true}}"])</script>
     """
 
-    extractor = NextJSHydrationDataExtractor()
-    chunks = extractor.parse(html_content)
+    extractor = _EXTRACTOR
+    chunks = extractor.iter_parse(html_content)
 
     print("\n=== Multi-chunk Assembly Example ===")
 
     for chunk in chunks:
-        print(f"\nChunk {chunk['chunk_id']}:")
-        print(f"  Assembled from {chunk['chunk_count']} fragments")
-        print(f"  Original positions: {chunk['_positions']}")
+        lines = [
+            f"\nChunk {chunk['chunk_id']}:",
+            f"  Assembled from {chunk['chunk_count']} fragments",
+            f"  Original positions: {chunk['_positions']}",
+        ]
 
         for item in chunk["extracted_data"]:
             if isinstance(item["data"], dict):
-                print(f"  Assembled data keys: {list(item['data'].keys())}")
+                lines.append(f"  Assembled data keys: {list(item['data'].keys())}")
                 if "bigDataSet" in item["data"]:
                     dataset = item["data"]["bigDataSet"]
-                    print(f"    Big dataset length: {len(dataset)} items")
-                    print(f"    Items: {dataset}")
+                    lines.append(f"    Big dataset length: {len(dataset)} items")
+                    lines.append(f"    Items: {dataset}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def custom_pattern_search_example():
@@ -113,7 +142,7 @@ def custom_pattern_search_example():
     <script>self.__next_f.push([3,"{\\"inventory\\":{\\"laptop\\":{\\"inStock\\":15,\\"reserved\\":3,\\"available\\":12}}}"])</script>
     """
 
-    extractor = NextJSHydrationDataExtractor()
+    extractor = _EXTRACTOR
     chunks = extractor.parse(html_content)
 
     print("\n=== Custom Pattern Search Example ===")
@@ -121,8 +150,11 @@ def custom_pattern_search_example():
     # Search for different patterns
     patterns_to_search = ["product", "review", "stock", "rating", "cpu"]
 
+    # One traversal answers every pattern
+    matches_by_pattern = extractor.find_data_by_patterns(chunks, patterns_to_search)
+
     for pattern in patterns_to_search:
-        matches = extractor.find_data_by_pattern(chunks, pattern)
+        matches = matches_by_pattern[pattern]
         if matches:
             print(f"\nPattern '{pattern}' found {len(matches)} times:")
             for match in matches:
@@ -143,30 +175,34 @@ def performance_example():
     print("\n=== Performance Example ===")
     print("Generating large dataset...")
 
-    # Create HTML with many chunks
-    html_parts = ["<html><body>"]
+    # Create HTML with many chunks, building the page as bytes in one buffer
+    buffer = bytearray(b"<html><body>\n")
 
     for i in range(100):  # 100 chunks
         chunk_data = {
             "batch": i,
             "items": [{"id": j, "value": f"item_{i}_{j}"} for j in range(10)],
         }
-        json_data = json.dumps(chunk_data).replace('"', '\\"')
-        html_parts.append(
-            f'<script>self.__next_f.push([{i % 10},"{json_data}"])</script>'
-        )
+        if orjson is not None:
+            json_data = orjson.dumps(chunk_data)
+        else:
+            json_data = json.dumps(chunk_data).encode("utf-8")
+        json_data = json_data.replace(b'"', b'\\"')
+        buffer += b'<script>self.__next_f.push([%d,"' % (i % 10)
+        buffer += json_data
+        buffer += b'"])</script>\n'
 
-    html_parts.append("</body></html>")
-    html_content = "\n".join(html_parts)
+    buffer += b"</body></html>"
+    html_content = bytes(buffer)
 
-    print(f"Generated HTML with {len(html_content)} characters")
+    print(f"Generated HTML with {len(html_content)} bytes")
 
     # Time the parsing
     import time
 
     start_time = time.time()
 
-    extractor = NextJSHydrationDataExtractor()
+    extractor = _EXTRACTOR
     chunks = extractor.parse(html_content)
 
     end_time = time.time()
@@ -177,11 +213,15 @@ def performance_example():
     total_items = sum(len(chunk["extracted_data"]) for chunk in chunks)
     print(f"Total data items processed: {total_items}")
 
-    # Show memory usage (approximate)
-    import sys
+    # Measure peak memory of a separate parse, so tracing overhead doesn't
+    # skew the timing above
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    extractor.parse(html_content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
 
-    memory_usage = sys.getsizeof(chunks) + sum(sys.getsizeof(chunk) for chunk in chunks)
-    print(f"Approximate memory usage: {memory_usage / 1024:.1f} KB")
+    print(f"Peak memory during parse: {(peak - baseline) / 1024:.1f} KB")
 
 
 def main():
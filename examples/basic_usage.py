@@ -8,6 +8,9 @@ hydration data from Next.js HTML content.
 
 from nextjs_hydration_parser import NextJSHydrationDataExtractor
 
+# An extractor can be created once and reused for any number of pages
+_EXTRACTOR = NextJSHydrationDataExtractor()
+
 
 def basic_example():
     """Demonstrate basic parsing functionality"""
@@ -30,8 +33,8 @@ def basic_example():
     </html>
     """
 
-    # Create extractor and parse
-    extractor = NextJSHydrationDataExtractor()
+    # Parse with the shared extractor
+    extractor = _EXTRACTOR
     chunks = extractor.parse(html_content)
 
     print("=== Basic Parsing Results ===")
@@ -59,7 +62,7 @@ def search_example():
     <script>self.__next_f.push([3,"{\\"user\\":{\\"id\\":123,\\"preferences\\":{\\"theme\\":\\"dark\\",\\"language\\":\\"en\\"}}}"])</script>
     """
 
-    extractor = NextJSHydrationDataExtractor()
+    extractor = _EXTRACTOR
     chunks = extractor.parse(html_content)
 
     print("\n=== Search Examples ===")
@@ -7,8 +7,36 @@ a simulated Next.js e-commerce site.
 """
 
 import json
+from array import array
+from collections import Counter
 from nextjs_hydration_parser import NextJSHydrationDataExtractor
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the standard library handles small catalogs
+    np = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+# Catalogs larger than this use NumPy for the price reductions
+NUMPY_MIN_PRODUCTS = 256
+
+_EXTRACTOR = NextJSHydrationDataExtractor()
+
+
+def pretty_json(data):
+    """Format data as 2-space indented JSON"""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2)
+
 
 def simulate_ecommerce_html():
     """Generate sample HTML that mimics a real Next.js e-commerce site"""
@@ -40,8 +68,8 @@ def simulate_ecommerce_html():
 def extract_product_data(html_content):
     """Extract and organize product data from HTML"""
 
-    extractor = NextJSHydrationDataExtractor()
-    chunks = extractor.parse(html_content)
+    extractor = _EXTRACTOR
+    chunks = extractor.iter_parse(html_content)
 
     # Organize extracted data
     extracted_data = {
@@ -94,28 +122,40 @@ def analyze_products(product_data):
     print(f"Total products found: {len(products)}")
 
     if products:
+        # Collect price, stock, brand and category stats in a single pass
+        prices = array("d")
+        in_stock = 0
+        brands, categories = Counter(), Counter()
+
+        for product in products:
+            price = product.get("price")
+            if price is not None:
+                prices.append(price)
+
+            if product.get("inStock", False):
+                in_stock += 1
+
+            brands[product.get("brand", "Unknown")] += 1
+            categories[product.get("category", "Unknown")] += 1
+
         # Price analysis
-        prices = [p["price"] for p in products if "price" in p]
         if prices:
-            print(f"Price range: ${min(prices):.2f} - ${max(prices):.2f}")
-            print(f"Average price: ${sum(prices)/len(prices):.2f}")
+            if np is not None and len(prices) > NUMPY_MIN_PRODUCTS:
+                price_values = np.frombuffer(prices, dtype=np.float64)
+                min_price, max_price = price_values.min(), price_values.max()
+                average_price = price_values.mean()
+            else:
+                min_price, max_price = min(prices), max(prices)
+                average_price = sum(prices) / len(prices)
+
+            print(f"Price range: ${min_price:.2f} - ${max_price:.2f}")
+            print(f"Average price: ${average_price:.2f}")
 
         # Stock analysis
-        in_stock = len([p for p in products if p.get("inStock", False)])
         print(f"In stock: {in_stock}/{len(products)} products")
 
-        # Brand analysis
-        brands = {}
-        for product in products:
-            brand = product.get("brand", "Unknown")
-            brands[brand] = brands.get(brand, 0) + 1
+        # Brand and category analysis
         print(f"Brands: {dict(brands)}")
-
-        # Category analysis
-        categories = {}
-        for product in products:
-            category = product.get("category", "Unknown")
-            categories[category] = categories.get(category, 0) + 1
         print(f"Categories: {dict(categories)}")
 
 
@@ -163,7 +203,7 @@ def main():
     print(f"\n=== Raw Data Sample ===")
     if product_data["products"]:
         print("First product:")
-        print(json.dumps(product_data["products"][0], indent=2))
+        print(pretty_json(product_data["products"][0]))
 
     print(f"\nCategories found:")
     for category in product_data["categories"]:
@@ -6,50 +6,190 @@ This example shows how to scrape actual Next.js websites.
 Note: Always respect robots.txt and rate limits when scraping.
 """
 
+import functools
+import hashlib
+import io
+import shelve
+import sys
+import threading
 import requests
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
 from nextjs_hydration_parser import NextJSHydrationDataExtractor
 
+# Reused across scraped pages instead of building one per URL
+_EXTRACTOR = NextJSHydrationDataExtractor()
 
-def scrape_with_requests(url, delay=1):
+# Pages are kept on disk between runs and revalidated with ETag/Last-Modified
+CACHE_DIR = Path.home() / ".cache" / "nextjs-hydration-parser"
+
+# Be respectful: never have more than this many requests open to one host.
+# With a single slot, the courtesy delay also spaces out requests to a site.
+MAX_REQUESTS_PER_HOST = 1
+
+# Headers to appear more like a real browser
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+_CACHE_FIELDS = {"etag", "last_modified", "content"}
+_cache_lock = threading.Lock()
+_host_limits = {}
+_host_limits_lock = threading.Lock()
+
+
+def create_session():
+    """Create a requests session that pools connections across scrapes"""
+
+    session = requests.Session()
+    session.headers.update(HEADERS)
+
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+_SESSION = create_session()
+
+
+def _host_limit(url):
+    """Return the semaphore limiting concurrent requests to the URL's host"""
+
+    host = urlsplit(url).netloc
+    with _host_limits_lock:
+        if host not in _host_limits:
+            _host_limits[host] = threading.Semaphore(MAX_REQUESTS_PER_HOST)
+        return _host_limits[host]
+
+
+def _read_cache(key):
+    """Return the cached entry for a key, or None if there is no usable one"""
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with _cache_lock, shelve.open(str(CACHE_DIR / "pages")) as cache:
+            entry = cache.get(key)
+    except Exception:
+        # The cache is only an optimization; a corrupt or unreadable
+        # cache file means the page is fetched without it
+        return None
+
+    if isinstance(entry, dict) and _CACHE_FIELDS <= entry.keys():
+        return entry
+    return None
+
+
+def _write_cache(key, entry):
+    """Store an entry in the page cache, ignoring cache errors"""
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with _cache_lock, shelve.open(str(CACHE_DIR / "pages")) as cache:
+            cache[key] = entry
+    except Exception:
+        pass
+
+
+@functools.lru_cache(maxsize=64)
+def _fetch_page(url, delay, session):
     """
-    Scrape a URL and extract Next.js hydration data
+    Fetch a page, reusing the on-disk copy when the server reports 304
+
+    Failed requests raise, so they are never cached.
 
     Args:
-        url (str): URL to scrape
-        delay (int): Delay in seconds between requests (be respectful!)
+        url (str): URL to fetch
+        delay (int): Delay in seconds after a network request
+        session (requests.Session): Session used for the request
 
     Returns:
-        dict: Extracted data
+        Tuple[int, bytes]: Response status code and raw HTML body
     """
 
-    # Headers to appear more like a real browser
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-    }
+    key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    cached = _read_cache(key)
+
+    headers = {}
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    with _host_limit(url):
+        # Stream the body and keep it as bytes; the parser scans bytes directly,
+        # so there is no need to decode the whole page into a str first
+        with session.get(url, headers=headers, timeout=10, stream=True) as response:
+            if response.status_code == 304 and cached:
+                not_modified = True
+                html_content = cached["content"]
+            elif response.status_code == 304:
+                # Nothing to revalidate against; don't cache the empty body
+                raise requests.HTTPError(
+                    f"304 Not Modified without a cached copy of {url}",
+                    response=response,
+                )
+            else:
+                not_modified = False
+                response.raise_for_status()
+                html_content = response.content
+
+        # Add delay to be respectful while still holding the host slot;
+        # other sites proceed in parallel
+        time.sleep(delay)
 
-    try:
-        print(f"Fetching: {url}")
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+    if not not_modified:
+        _write_cache(
+            key,
+            {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "content": html_content,
+            },
+        )
 
-        print(f"Response status: {response.status_code}")
-        print(f"Content length: {len(response.text)} characters")
+    return response.status_code, html_content
 
-        # Add delay to be respectful
-        time.sleep(delay)
 
-        return response.text
+def scrape_with_requests(url, delay=1, session=None, out=None):
+    """
+    Scrape a URL and extract Next.js hydration data
+
+    Repeated calls for the same URL are served from memory, and pages
+    fetched in earlier runs are revalidated instead of downloaded again.
+
+    Args:
+        url (str): URL to scrape
+        delay (int): Delay in seconds between requests (be respectful!)
+        session (requests.Session): Session to reuse; defaults to a shared one
+        out: Stream for progress messages; defaults to sys.stdout
+
+    Returns:
+        bytes: Raw HTML body, or None if the request failed
+    """
 
+    print(f"Fetching: {url}", file=out)
+    try:
+        status_code, html_content = _fetch_page(url, delay, session or _SESSION)
     except requests.RequestException as e:
-        print(f"Error fetching {url}: {e}")
+        print(f"Error fetching {url}: {e}", file=out)
         return None
 
+    print(f"Response status: {status_code}", file=out)
+    print(f"Content length: {len(html_content)} bytes", file=out)
+    return html_content
+
 
 def extract_and_analyze(html_content, url):
     """Extract and analyze hydration data from HTML"""
@@ -57,7 +197,7 @@ def extract_and_analyze(html_content, url):
     if not html_content:
         return
 
-    extractor = NextJSHydrationDataExtractor()
+    extractor = _EXTRACTOR
     chunks = extractor.parse(html_content)
 
     print(f"\n=== Analysis for {url} ===")
@@ -67,20 +207,18 @@ def extract_and_analyze(html_content, url):
         print("No Next.js hydration data found - this might not be a Next.js site")
         return
 
-    # Basic statistics
-    total_items = sum(len(chunk["extracted_data"]) for chunk in chunks)
-    error_chunks = len([c for c in chunks if c["chunk_id"] == "error"])
+    # Basic statistics and data types, gathered in one pass over the chunks
+    total_items = 0
+    error_chunks = 0
+    data_types = Counter()
+    for chunk in chunks:
+        extracted_data = chunk["extracted_data"]
+        total_items += len(extracted_data)
+        error_chunks += chunk["chunk_id"] == "error"
+        data_types.update(item["type"] for item in extracted_data)
 
     print(f"Total data items: {total_items}")
     print(f"Error chunks: {error_chunks}")
-
-    # Analyze data types
-    data_types = {}
-    for chunk in chunks:
-        for item in chunk["extracted_data"]:
-            item_type = item["type"]
-            data_types[item_type] = data_types.get(item_type, 0) + 1
-
     print(f"Data types found: {dict(data_types)}")
 
     # Get all keys
@@ -90,12 +228,12 @@ def extract_and_analyze(html_content, url):
 
     # Look for common e-commerce patterns
     ecommerce_patterns = ["product", "price", "cart", "category", "inventory"]
-    found_patterns = []
-
-    for pattern in ecommerce_patterns:
-        matches = extractor.find_data_by_pattern(chunks, pattern)
-        if matches:
-            found_patterns.append(f"{pattern}({len(matches)})")
+    matches_by_pattern = extractor.find_data_by_patterns(chunks, ecommerce_patterns)
+    found_patterns = [
+        f"{pattern}({len(matches)})"
+        for pattern, matches in matches_by_pattern.items()
+        if matches
+    ]
 
     if found_patterns:
         print(f"E-commerce patterns found: {', '.join(found_patterns)}")
@@ -124,8 +262,19 @@ def test_known_nextjs_sites():
     print("Note: This is for educational purposes only.")
     print("Always respect robots.txt and site terms of service.\n")
 
-    for url in test_sites:
-        html_content = scrape_with_requests(url, delay=2)  # Be respectful with delays
+    def fetch(url):
+        # Buffer the progress messages so sites fetched in parallel don't
+        # interleave their output
+        out = io.StringIO()
+        html_content = scrape_with_requests(url, delay=2, out=out)  # Be respectful
+        return html_content, out.getvalue()
+
+    # Fetch the sites concurrently; each host is still rate-limited
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pages = list(executor.map(fetch, test_sites))
+
+    for url, (html_content, fetch_log) in zip(test_sites, pages):
+        sys.stdout.write(fetch_log)
         extract_and_analyze(html_content, url)
         print("-" * 50)
 
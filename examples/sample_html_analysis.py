@@ -6,14 +6,41 @@ This example demonstrates parsing the included sample Next.js HTML file
 that contains realistic e-commerce hydration data.
 """
 
+import io
 import json
 import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from nextjs_hydration_parser import NextJSHydrationDataExtractor
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
 
+
+def pretty_json(data):
+    """Serialize data as indented JSON for display"""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2)
+
+
+# Identifiers of API responses and config blobs, matched without lowercasing
+_is_api_identifier = re.compile(r"api|config", re.IGNORECASE).search
+
+
+@lru_cache(maxsize=1)
 def load_sample_html():
-    """Load the sample HTML file"""
+    """Load the sample HTML file as raw bytes (read once and cached)"""
 
     # Get the path to the sample HTML file
     current_dir = Path(__file__).parent
@@ -23,45 +50,54 @@ def load_sample_html():
         print(f"ERROR: Sample file not found: {sample_file}")
         return None
 
-    with open(sample_file, "r", encoding="utf-8") as f:
-        return f.read()
+    # The parser accepts bytes directly, so skip the UTF-8 decode
+    return sample_file.read_bytes()
 
 
-def analyze_sample_data(chunks):
+def analyze_sample_data(chunks, out=None):
     """Analyze the extracted data from sample HTML"""
 
-    print("=== SAMPLE DATA ANALYSIS ===")
-    print(f"Total chunks found: {len(chunks)}")
+    lines = ["=== SAMPLE DATA ANALYSIS ===", f"Total chunks found: {len(chunks)}"]
 
     # Overview of chunk IDs
-    chunk_ids = [chunk["chunk_id"] for chunk in chunks if chunk["chunk_id"] != "error"]
-    print(f"Chunk IDs: {sorted(set(chunk_ids))}")
+    chunk_ids = sorted(
+        {chunk["chunk_id"] for chunk in chunks if chunk["chunk_id"] != "error"}
+    )
+    lines.append(f"Chunk IDs: {chunk_ids}")
 
     # Multi-chunk analysis
     multi_chunks = [chunk for chunk in chunks if chunk["chunk_count"] > 1]
     if multi_chunks:
-        print(f"Multi-chunk data found: {len(multi_chunks)} chunks")
-        for chunk in multi_chunks:
-            print(f"  Chunk {chunk['chunk_id']}: {chunk['chunk_count']} parts")
+        lines.append(f"Multi-chunk data found: {len(multi_chunks)} chunks")
+        lines.extend(
+            f"  Chunk {chunk['chunk_id']}: {chunk['chunk_count']} parts"
+            for chunk in multi_chunks
+        )
 
     # Data type analysis
-    data_types = {}
-    for chunk in chunks:
-        for item in chunk["extracted_data"]:
-            data_type = item["type"]
-            data_types[data_type] = data_types.get(data_type, 0) + 1
+    data_types = Counter(
+        item["type"] for chunk in chunks for item in chunk["extracted_data"]
+    )
+
+    lines.append(f"Data types found: {dict(data_types)}")
 
-    print(f"Data types found: {dict(data_types)}")
+    # One write for the whole section instead of a print per line
+    print("\n".join(lines), file=out)
 
 
-def extract_ecommerce_data(chunks, extractor):
+def extract_ecommerce_data(chunks, extractor, out=None):
     """Extract specific e-commerce data patterns"""
 
-    print("\n=== E-COMMERCE DATA EXTRACTION ===")
+    print("\n=== E-COMMERCE DATA EXTRACTION ===", file=out)
+
+    # Search for all patterns in a single pass over the chunks
+    matches = extractor.find_data_by_patterns(
+        chunks, ["product", "categor", "cart", "recommend"]
+    )
 
     # Extract products
-    products = extractor.find_data_by_pattern(chunks, "product")
-    print(f"Products found: {len(products)} matches")
+    products = matches["product"]
+    print(f"Products found: {len(products)} matches", file=out)
 
     if products:
         for i, product_match in enumerate(products[:3]):  # Show first 3
@@ -69,20 +105,22 @@ def extract_ecommerce_data(chunks, extractor):
             if isinstance(product_data, list) and len(product_data) > 0:
                 product = product_data[0]  # First product in array
                 print(
-                    f"  Product {i+1}: {product.get('name', 'Unknown')} - ${product.get('price', 'N/A')}"
+                    f"  Product {i+1}: {product.get('name', 'Unknown')} - ${product.get('price', 'N/A')}",
+                    file=out,
                 )
             elif isinstance(product_data, dict):
                 print(
-                    f"  Product {i+1}: {product_data.get('name', 'Unknown')} - ${product_data.get('price', 'N/A')}"
+                    f"  Product {i+1}: {product_data.get('name', 'Unknown')} - ${product_data.get('price', 'N/A')}",
+                    file=out,
                 )
 
     # Extract categories
-    categories = extractor.find_data_by_pattern(chunks, "categor")
-    print(f"Categories found: {len(categories)} matches")
+    categories = matches["categor"]
+    print(f"Categories found: {len(categories)} matches", file=out)
 
     # Extract user/cart data
-    cart_data = extractor.find_data_by_pattern(chunks, "cart")
-    print(f"Cart data found: {len(cart_data)} matches")
+    cart_data = matches["cart"]
+    print(f"Cart data found: {len(cart_data)} matches", file=out)
 
     if cart_data:
         for cart_match in cart_data[:1]:  # Show first match
@@ -90,65 +128,59 @@ def extract_ecommerce_data(chunks, extractor):
             if isinstance(cart, dict):
                 items = cart.get("items", [])
                 total = cart.get("total", 0)
-                print(f"  Cart: {len(items)} items, total: ${total}")
+                print(f"  Cart: {len(items)} items, total: ${total}", file=out)
 
     # Extract recommendations
-    recommendations = extractor.find_data_by_pattern(chunks, "recommend")
-    print(f"Recommendations found: {len(recommendations)} matches")
+    recommendations = matches["recommend"]
+    print(f"Recommendations found: {len(recommendations)} matches", file=out)
 
 
-def extract_api_data(chunks):
+def extract_api_data(chunks, out=None):
     """Extract API response data"""
 
-    print("\n=== API DATA EXTRACTION ===")
-
-    api_chunks = []
+    # Describe each API chunk as it is found, without collecting the chunks
+    api_count = 0
+    api_lines = []
     for chunk in chunks:
         for item in chunk["extracted_data"]:
             if item["type"] == "colon_separated":
-                identifier = item.get("identifier", "").lower()
-                if "api" in identifier or "config" in identifier:
-                    api_chunks.append(
-                        {
-                            "identifier": item.get("identifier", "unknown"),
-                            "data": item["data"],
-                        }
-                    )
-
-    print(f"API/Config data chunks: {len(api_chunks)}")
+                if _is_api_identifier(item.get("identifier", "")):
+                    api_count += 1
+                    identifier = item.get("identifier", "unknown")
+                    data = item["data"]
+                    api_lines.append(f"  {identifier}: {type(data).__name__}")
 
-    for api_chunk in api_chunks:
-        identifier = api_chunk["identifier"]
-        data = api_chunk["data"]
-        print(f"  {identifier}: {type(data).__name__}")
+                    if isinstance(data, dict):
+                        keys = list(data.keys())[:5]  # First 5 keys
+                        api_lines.append(f"    Keys: {keys}")
 
-        if isinstance(data, dict):
-            keys = list(data.keys())[:5]  # First 5 keys
-            print(f"    Keys: {keys}")
+    header = ["\n=== API DATA EXTRACTION ===", f"API/Config data chunks: {api_count}"]
+    print("\n".join(header + api_lines), file=out)
 
 
-def show_key_analysis(chunks, extractor):
+def show_key_analysis(chunks, extractor, out=None):
     """Show key analysis of all data"""
 
-    print("\n=== KEY ANALYSIS ===")
-
     # Get all keys
     all_keys = extractor.get_all_keys(chunks, max_depth=3)
 
-    # Sort by frequency
-    sorted_keys = sorted(all_keys.items(), key=lambda x: x[1], reverse=True)
+    # Top 15 keys by frequency, without sorting every key
+    top_keys = Counter(all_keys).most_common(15)
 
-    print(f"Total unique keys found: {len(all_keys)}")
-    print("Most common keys:")
+    lines = [
+        "\n=== KEY ANALYSIS ===",
+        f"Total unique keys found: {len(all_keys)}",
+        "Most common keys:",
+    ]
+    lines.extend(f"  {key}: {count} occurrences" for key, count in top_keys)
 
-    for key, count in sorted_keys[:15]:  # Top 15 keys
-        print(f"  {key}: {count} occurrences")
+    print("\n".join(lines), file=out)
 
 
-def demonstrate_search_patterns(chunks, extractor):
+def demonstrate_search_patterns(chunks, extractor, out=None):
     """Demonstrate various search patterns"""
 
-    print("\n=== SEARCH PATTERN DEMONSTRATIONS ===")
+    lines = ["\n=== SEARCH PATTERN DEMONSTRATIONS ==="]
 
     # Common e-commerce search patterns
     patterns = [
@@ -162,22 +194,34 @@ def demonstrate_search_patterns(chunks, extractor):
         ("error", "Error handling"),
     ]
 
+    matches_by_pattern = extractor.find_data_by_patterns(
+        chunks, [pattern for pattern, _ in patterns]
+    )
+
     for pattern, description in patterns:
-        matches = extractor.find_data_by_pattern(chunks, pattern)
+        matches = matches_by_pattern[pattern]
         if matches:
-            print(f"  {description}: {len(matches)} matches")
+            lines.append(f"  {description}: {len(matches)} matches")
 
             # Show sample data for first match
             sample = matches[0]["value"]
             if isinstance(sample, (dict, list)):
-                sample_str = (
-                    json.dumps(sample, indent=2)[:200] + "..."
-                    if len(str(sample)) > 200
-                    else json.dumps(sample, indent=2)
-                )
-                print(f"    Sample: {sample_str}")
+                # Serialize once, then truncate
+                dumped = pretty_json(sample)
+                ellipsis = "..." if len(dumped) > 200 else ""
+                lines.append(f"    Sample: {dumped[:200]}{ellipsis}")
             else:
-                print(f"    Sample: {str(sample)[:100]}...")
+                lines.append(f"    Sample: {str(sample)[:100]}...")
+
+    print("\n".join(lines), file=out)
+
+
+def run_captured(analysis, *args):
+    """Run one analysis and return everything it printed"""
+
+    out = io.StringIO()
+    analysis(*args, out=out)
+    return out.getvalue()
 
 
 def main():
@@ -191,18 +235,32 @@ def main():
     if not html_content:
         return
 
-    print(f"Loaded sample HTML: {len(html_content)} characters")
+    print(f"Loaded sample HTML: {len(html_content)} bytes")
 
     # Parse hydration data
     extractor = NextJSHydrationDataExtractor()
     chunks = extractor.parse(html_content)
 
-    # Run analysis
-    analyze_sample_data(chunks)
-    extract_ecommerce_data(chunks, extractor)
-    extract_api_data(chunks)
-    show_key_analysis(chunks, extractor)
-    demonstrate_search_patterns(chunks, extractor)
+    if not chunks:
+        print("No Next.js hydration data found in the sample HTML")
+        return
+
+    # The analyses only read the chunks, so run them concurrently. Each one
+    # prints into its own buffer and the buffers are written out in order.
+    analyses = [
+        (analyze_sample_data, (chunks,)),
+        (extract_ecommerce_data, (chunks, extractor)),
+        (extract_api_data, (chunks,)),
+        (show_key_analysis, (chunks, extractor)),
+        (demonstrate_search_patterns, (chunks, extractor)),
+    ]
+    with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+        futures = [
+            executor.submit(run_captured, analysis, *args)
+            for analysis, args in analyses
+        ]
+        for future in futures:
+            sys.stdout.write(future.result())
 
     # Show raw data for one chunk
     print("\n=== SAMPLE RAW DATA ===")
@@ -213,7 +271,7 @@ def main():
 
         if isinstance(sample_item["data"], dict):
             print("Sample data structure:")
-            print(json.dumps(sample_item["data"], indent=2)[:500] + "...")
+            print(pretty_json(sample_item["data"])[:500] + "...")
         else:
             print(f"Raw data: {str(sample_item['data'])[:300]}...")
 
@@ -1,9 +1,121 @@
 import re
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from typing import Callable, Dict, Iterator, List, Any, Optional, Pattern, Union
 import chompjs
 
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator, see extras_require["fast"]
+    hyperscan = None
+
+try:
+    import simdjson
+except ImportError:  # Optional accelerator, see extras_require["fast"]
+    simdjson = None
+
+# Compiled once at import time so parse() skips the re module's cache lookup.
+# Note the lazy body still scans to the end of the input for any prefix that
+# has no closing "])", so this does not change the complexity of the scan.
+_SCRIPT_PATTERN = r"self\.__next_f\.push\(\[(.*?)\]\)"
+_SCRIPT_RE = re.compile(_SCRIPT_PATTERN, re.DOTALL)
+_SCRIPT_RE_BYTES = re.compile(_SCRIPT_PATTERN.encode("ascii"), re.DOTALL)
+
+_PUSH_PREFIX = b"self.__next_f.push(["
+_PUSH_SUFFIX = b"])"
+
+# One JSON string escape: \uXXXX or a backslash followed by any character
+_JSON_ESCAPE_RE = re.compile(r"\\(?:u([0-9a-fA-F]{4})|(.))", re.DOTALL)
+_JSON_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+def _unescape_json_text(text: str) -> str:
+    """
+    Decode one level of JSON string escapes anywhere in the text.
+
+    This is only used to test raw payloads for substrings, so it works on
+    the whole text at once and leaves unknown escapes untouched.
+    """
+
+    def replace(match):
+        if match.group(1) is not None:
+            return chr(int(match.group(1), 16))
+        return _JSON_SIMPLE_ESCAPES.get(match.group(2), match.group(0))
+
+    unescaped = _JSON_ESCAPE_RE.sub(replace, text)
+    # Join surrogate pairs written as two \uXXXX escapes
+    return unescaped.encode("utf-16", "surrogatepass").decode("utf-16", "replace")
+
+
+def _compile_hyperscan_database():
+    """Build a block-mode Hyperscan database for the push-call prefix."""
+
+    if hyperscan is None:
+        return None
+
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(_PUSH_PREFIX)], ids=[0], elements=1, flags=[0]
+        )
+        return database
+    except Exception:
+        logging.getLogger(__name__).debug(
+            "Hyperscan unavailable, falling back to re", exc_info=True
+        )
+        return None
+
+
+_HYPERSCAN_DB = _compile_hyperscan_database()
+
+# A Hyperscan scratch space can only be used by one scan at a time
+_hyperscan_local = threading.local()
+
+
+def _get_hyperscan_scratch():
+    """Return this thread's Hyperscan scratch space, allocating it once."""
+
+    scratch = getattr(_hyperscan_local, "scratch", None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(_HYPERSCAN_DB)
+    return scratch
+
+
+# simdjson parsers are not safe to share between threads
+_simdjson_local = threading.local()
+
+
+def _loads_json(text: str) -> Any:
+    """
+    Decode strict JSON, using simdjson when it is installed.
+
+    Raises:
+        ValueError: If the text is not valid JSON
+    """
+
+    if simdjson is not None:
+        parser = getattr(_simdjson_local, "parser", None)
+        if parser is None:
+            parser = _simdjson_local.parser = simdjson.Parser()
+        try:
+            return parser.parse(text.encode("utf-8"), recursive=True)
+        except (ValueError, RuntimeError):
+            # simdjson is stricter than json (e.g. NaN) and raises RuntimeError
+            # for integers beyond 64 bits, so let json decide
+            pass
+
+    return json.loads(text)
+
 
 class NextJSHydrationDataExtractor:
     """
@@ -17,26 +129,110 @@ class NextJSHydrationDataExtractor:
         """
         Initialize the extractor.
         """
-        self.script_pattern = r"self\.__next_f\.push\(\[(.*?)\]\)"
+        # Overriding this on an instance makes parse() use that regex instead
+        # of the precompiled default (and skips the Hyperscan scanner)
+        self.script_pattern = _SCRIPT_PATTERN
         self.logger = logging.getLogger(__name__)
 
-    def parse(self, html_content: str) -> List[Dict[str, Any]]:
+    def parse(self, html_content: Union[str, bytes]) -> List[Dict[str, Any]]:
         """
         Parse Next.js/Nuxt.js hydration data from script tags containing self.__next_f.push calls.
         Returns a list of parsed data chunks, preserving all available information.
 
         Args:
-            html_content (str): Raw HTML content containing script tags
+            html_content (Union[str, bytes]): Raw HTML content containing script tags.
+                Bytes are scanned as-is (positions are byte offsets) and only the
+                matched payloads are decoded as UTF-8.
 
         Returns:
             List[Dict[str, Any]]: List of parsed data chunks
         """
 
+        return list(self.iter_parse(html_content))
+
+    def iter_parse(self, html_content: Union[str, bytes]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily parse hydration data, yielding one processed chunk at a time.
+
+        All script tags are scanned up front so continuations can be grouped,
+        but the expensive data extraction for each chunk ID only runs when that
+        chunk is consumed.
+
+        Args:
+            html_content (Union[str, bytes]): Raw HTML content containing script tags
+
+        Yields:
+            Dict[str, Any]: Parsed data chunks, in the same order as parse()
+        """
+
+        # Group chunks and handle continuations
+        yield from self._process_chunks(self._collect_raw_chunks(html_content))
+
+    def find_data_in_html(
+        self, html_content: Union[str, bytes], patterns: List[Union[str, Pattern]]
+    ) -> Dict[Union[str, Pattern], List[Any]]:
+        """
+        Search HTML for key patterns, only extracting chunks that can match.
+
+        A chunk whose raw data does not contain any of the patterns, either
+        as written or with its JSON escapes decoded, cannot have a matching
+        key, so its data extraction is skipped entirely.
+        This gives the same result as calling find_data_by_patterns on the
+        output of parse(), at a fraction of the cost on pages where most
+        chunks are irrelevant.
+
+        Args:
+            html_content (Union[str, bytes]): Raw HTML content containing script tags
+            patterns (List[Union[str, Pattern]]): Key patterns to search for,
+                as accepted by find_data_by_patterns
+
+        Returns:
+            Dict[Union[str, Pattern], List[Any]]: Matching data items for each
+                pattern, in the same format as find_data_by_pattern
+        """
+
+        # A regular expression cannot be checked against the raw text (it may
+        # be anchored to the whole key), so those searches extract everything
+        if not all(isinstance(pattern, str) for pattern in patterns):
+            return self.find_data_by_patterns(self.iter_parse(html_content), patterns)
+
+        lowered_patterns = [pattern.lower() for pattern in patterns]
+
+        def may_match(text):
+            # Keys can be spelled with JSON escapes (\/, \t, \uXXXX, ...),
+            # possibly nested, so also check each decoded level of the text
+            while True:
+                text_lower = text.lower()
+                if any(pattern in text_lower for pattern in lowered_patterns):
+                    return True
+                if "\\" not in text:
+                    return False
+                unescaped = _unescape_json_text(text)
+                if unescaped == text:
+                    return False
+                text = unescaped
+
+        chunks = self._process_chunks(
+            self._collect_raw_chunks(html_content), data_filter=may_match
+        )
+        return self.find_data_by_patterns(chunks, patterns)
+
+    def _collect_raw_chunks(
+        self, html_content: Union[str, bytes]
+    ) -> List[Dict[str, Any]]:
+        """
+        Scan the HTML and split every push call into chunk ID and raw data.
+
+        Args:
+            html_content (Union[str, bytes]): Raw HTML content
+
+        Returns:
+            List[Dict[str, Any]]: Raw chunks sorted by position
+        """
+
         # Find all script matches with their positions
         raw_chunks = []
-        for match in re.finditer(self.script_pattern, html_content, re.DOTALL):
-            chunk_content = match.group(1)
-            position = match.start()
+        for position, chunk_content in self._iter_script_matches(html_content):
 
             try:
                 # Parse the chunk content more carefully
@@ -59,10 +255,77 @@ class NextJSHydrationDataExtractor:
         # Sort by position to maintain order
         raw_chunks.sort(key=lambda x: x["_position"])
 
-        # Group chunks and handle continuations
-        processed_chunks = self._process_chunks(raw_chunks)
+        return raw_chunks
+
+    def _iter_script_matches(self, html_content: Union[str, bytes]):
+        """
+        Yield (position, content) for every self.__next_f.push call in the HTML.
+
+        Args:
+            html_content (Union[str, bytes]): Raw HTML content
+
+        Yields:
+            Tuple[int, str]: Match position and the content inside the brackets
+        """
+
+        is_bytes = isinstance(html_content, (bytes, bytearray))
+        custom_pattern = self.script_pattern != _SCRIPT_PATTERN
+
+        if is_bytes and not custom_pattern and _HYPERSCAN_DB is not None:
+            yield from self._iter_hyperscan_matches(bytes(html_content))
+            return
+
+        if custom_pattern:
+            pattern = self.script_pattern
+            if is_bytes:
+                pattern = pattern.encode("utf-8")
+            script_re = re.compile(pattern, re.DOTALL)
+        else:
+            script_re = _SCRIPT_RE_BYTES if is_bytes else _SCRIPT_RE
+
+        for match in script_re.finditer(html_content):
+            content = match.group(1)
+            if is_bytes:
+                content = content.decode("utf-8", errors="replace")
+            yield match.start(), content
+
+    def _iter_hyperscan_matches(self, html_bytes: bytes):
+        """
+        Yield push calls found by Hyperscan, mirroring the regex scanner.
+
+        Hyperscan only reports where each push-call prefix ends; the payload
+        runs up to the first following "])", exactly like the lazy regex.
+
+        Args:
+            html_bytes (bytes): Raw HTML content
+
+        Yields:
+            Tuple[int, str]: Match position and the content inside the brackets
+        """
+
+        prefix_ends = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            prefix_ends.append(end)
 
-        return processed_chunks
+        _HYPERSCAN_DB.scan(
+            html_bytes, match_event_handler=on_match, scratch=_get_hyperscan_scratch()
+        )
+
+        last_end = 0
+        for content_start in prefix_ends:
+            position = content_start - len(_PUSH_PREFIX)
+            if position < last_end:
+                # Prefix sits inside the previous payload, as with finditer
+                continue
+
+            content_end = html_bytes.find(_PUSH_SUFFIX, content_start)
+            if content_end == -1:
+                break
+
+            last_end = content_end + len(_PUSH_SUFFIX)
+            content = html_bytes[content_start:content_end]
+            yield position, content.decode("utf-8", errors="replace")
 
     def _parse_single_chunk(self, content: str) -> Optional[Dict[str, Any]]:
         """
@@ -115,49 +378,47 @@ class NextJSHydrationDataExtractor:
         # Strategy 3: Treat entire content as data with unknown ID
         return {"chunk_id": "unknown", "raw_data": content, "parsed_data": None}
 
-    def _process_chunks(self, raw_chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _process_chunks(
+        self,
+        raw_chunks: List[Dict[str, Any]],
+        data_filter: Optional[Callable[[str], bool]] = None,
+    ) -> Iterator[Dict[str, Any]]:
         """
         Process raw chunks, combining continuations and extracting JSON data.
 
         Args:
-            raw_chunks (List[Dict]): List of raw parsed chunks
+            raw_chunks (List[Dict]): List of raw parsed chunks, sorted by position
+            data_filter (Callable[[str], bool], optional): Called with the
+                combined raw data of each chunk ID; chunks it rejects are skipped
 
-        Returns:
-            List[Dict[str, Any]]: List of processed data chunks
+        Yields:
+            Dict[str, Any]: Processed data chunks, one per chunk ID
         """
 
-        # Group chunks by ID first
+        # Group chunks by ID first. raw_chunks is sorted by position, so each
+        # group is already in document order and needs no further sorting.
         chunks_by_id = {}
         for chunk in raw_chunks:
-            chunk_id = chunk["chunk_id"]
-            if chunk_id not in chunks_by_id:
-                chunks_by_id[chunk_id] = []
-            chunks_by_id[chunk_id].append(chunk)
+            chunks_by_id.setdefault(chunk["chunk_id"], []).append(chunk)
 
         # Process each group
-        result = []
-
         for chunk_id, chunk_list in chunks_by_id.items():
-            # Sort by position to maintain order
-            chunk_list.sort(key=lambda x: x["_position"])
-
-            # Combine all data for this chunk_id
+            # Combine all fragments for this chunk_id with a single join
             combined_data = "".join([chunk["raw_data"] for chunk in chunk_list])
 
+            if data_filter is not None and not data_filter(combined_data):
+                continue
+
             # Try to extract structured data
             extracted_items = self._extract_all_data_structures(combined_data)
 
-            processed_chunk = {
+            yield {
                 "chunk_id": chunk_id,
                 "extracted_data": extracted_items,
                 "chunk_count": len(chunk_list),
                 "_positions": [chunk["_position"] for chunk in chunk_list],
             }
 
-            result.append(processed_chunk)
-
-        return result
-
     def _extract_all_data_structures(self, text: str) -> List[Dict[str, Any]]:
         """
         Extract all possible data structures from a text string.
@@ -256,15 +517,15 @@ class NextJSHydrationDataExtractor:
 
         text = text.strip()
 
-        # Strategy 1: Try chompjs (best for JS objects)
+        # Strategy 1: Try strict JSON (fastest for the common case)
         try:
-            return chompjs.parse_js_object(text)
+            return _loads_json(text)
         except:
             pass
 
-        # Strategy 2: Try standard JSON
+        # Strategy 2: Try chompjs (best for JS objects)
         try:
-            return json.loads(text)
+            return chompjs.parse_js_object(text)
         except:
             pass
 
@@ -277,7 +538,7 @@ class NextJSHydrationDataExtractor:
 
         try:
             cleaned = self._clean_js_object(text)
-            return json.loads(cleaned)
+            return _loads_json(cleaned)
         except:
             pass
 
@@ -461,37 +722,94 @@ class NextJSHydrationDataExtractor:
         return dict(sorted(key_counts.items(), key=lambda x: x[1], reverse=True))
 
     def find_data_by_pattern(
-        self, parsed_chunks: List[Dict[str, Any]], pattern: str
+        self, parsed_chunks: List[Dict[str, Any]], pattern: Union[str, Pattern]
     ) -> List[Any]:
         """
         Find data that matches a specific pattern.
 
         Args:
             parsed_chunks (List[Dict]): Output from parse method
-            pattern (str): Key pattern to search for
+            pattern (Union[str, Pattern]): Key pattern to search for, either a
+                case-insensitive substring or a compiled regular expression
 
         Returns:
             List[Any]: List of matching data items
         """
 
-        results = []
+        return self.find_data_by_patterns(parsed_chunks, [pattern])[pattern]
+
+    def find_data_by_patterns(
+        self,
+        parsed_chunks: List[Dict[str, Any]],
+        patterns: List[Union[str, Pattern]],
+    ) -> Dict[Union[str, Pattern], List[Any]]:
+        """
+        Find data matching several patterns with a single traversal.
+
+        Args:
+            parsed_chunks (List[Dict]): Output from parse method
+            patterns (List[Union[str, Pattern]]): Key patterns to search for.
+                Strings match as case-insensitive substrings, compiled regular
+                expressions are matched with search() against the key
+
+        Returns:
+            Dict[Union[str, Pattern], List[Any]]: Matching data items for each
+                pattern, in the same format as find_data_by_pattern
+        """
+
+        results = {pattern: [] for pattern in patterns}
+        lowered_patterns = [
+            (pattern, pattern.lower())
+            for pattern in results
+            if isinstance(pattern, str)
+        ]
+        compiled_patterns = [
+            pattern for pattern in results if not isinstance(pattern, str)
+        ]
+
+        # Hydration payloads repeat the same keys many times, so remember
+        # which patterns each key matched instead of re-testing it
+        matches_by_key = {}
+
+        def matching_patterns(key):
+            matched = matches_by_key.get(key)
+            if matched is None:
+                key_lower = key.lower()
+                matched = [
+                    pattern
+                    for pattern, pattern_lower in lowered_patterns
+                    if pattern_lower in key_lower
+                ]
+                matched.extend(
+                    pattern for pattern in compiled_patterns if pattern.search(key)
+                )
+                matches_by_key[key] = matched
+            return matched
 
         def search_recursive(obj, path=""):
             if isinstance(obj, dict):
                 for key, value in obj.items():
+                    matched = matching_patterns(key)
+                    is_container = isinstance(value, (dict, list))
+
+                    # Only build the path when something will use it
+                    if not matched and not is_container:
+                        continue
+
                     current_path = f"{path}.{key}" if path else key
 
-                    if pattern.lower() in key.lower():
-                        results.append(
+                    for pattern in matched:
+                        results[pattern].append(
                             {"path": current_path, "key": key, "value": value}
                         )
 
-                    search_recursive(value, current_path)
+                    if is_container:
+                        search_recursive(value, current_path)
 
             elif isinstance(obj, list):
                 for i, item in enumerate(obj):
-                    current_path = f"{path}[{i}]"
-                    search_recursive(item, current_path)
+                    if isinstance(item, (dict, list)):
+                        search_recursive(item, f"{path}[{i}]")
 
         for chunk in parsed_chunks:
             if "extracted_data" in chunk:
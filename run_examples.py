@@ -7,10 +7,31 @@ This script runs all examples to demonstrate the library's capabilities.
 
 import sys
 import os
-import importlib.util
+import io
+import multiprocessing
+import runpy
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 
+# Examples that prompt for input; they only run under --interactive
+INTERACTIVE_EXAMPLES = {"real_world_scraping.py"}
+
+
+def find_example_files(examples_dir):
+    """List the example scripts in a directory, sorted by name"""
+
+    # A single directory scan; Path objects are only built for matches
+    with os.scandir(examples_dir) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".py") and entry.is_file()
+        )
+
+    return [Path(examples_dir, name) for name in names]
+
 
 def run_example(example_path):
     """Run a single example file"""
@@ -20,16 +41,13 @@ def run_example(example_path):
         print(f"Running: {example_path.name}")
         print(f"{'='*60}")
 
-        # Load and run the example module
-        spec = importlib.util.spec_from_file_location("example", example_path)
-        example = importlib.util.module_from_spec(spec)
-
         # Add the project root to sys.path so imports work
         project_root = example_path.parent.parent
         if str(project_root) not in sys.path:
             sys.path.insert(0, str(project_root))
 
-        spec.loader.exec_module(example)
+        # Run it like "python examples/<name>.py" so its __main__ block runs
+        runpy.run_path(str(example_path), run_name="__main__")
 
         print(f"\n✓ {example_path.name} completed successfully")
         return True
@@ -45,6 +63,16 @@ def run_example(example_path):
         return False
 
 
+def run_example_captured(example_path):
+    """Run a single example in a worker process, returning (success, output)"""
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        success = run_example(Path(example_path))
+
+    return success, output.getvalue()
+
+
 def main():
     """Run all examples"""
 
@@ -60,8 +88,9 @@ def main():
         return False
 
     # Find all Python example files
-    example_files = list(examples_dir.glob("*.py"))
-    example_files.sort()
+    example_files = find_example_files(examples_dir)
+    skipped_files = [f for f in example_files if f.name in INTERACTIVE_EXAMPLES]
+    example_files = [f for f in example_files if f.name not in INTERACTIVE_EXAMPLES]
 
     if not example_files:
         print(f"No example files found in {examples_dir}")
@@ -70,13 +99,37 @@ def main():
     print(f"Found {len(example_files)} example files:")
     for f in example_files:
         print(f"  - {f.name}")
+    for f in skipped_files:
+        print(f"  - {f.name} (interactive, skipped; use --interactive)")
 
     # Run examples
     results = {}
 
-    for example_file in example_files:
-        success = run_example(example_file)
-        results[example_file.name] = success
+    # Run each example in its own process, in parallel. Forked workers start
+    # with the parent's imports already loaded, and one example can't leak
+    # module state into the next. Output is captured per example and
+    # printed in order so runs don't interleave.
+    if "fork" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("fork")
+    else:
+        mp_context = None
+
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(), mp_context=mp_context
+    ) as executor:
+        futures = {
+            example_file.name: executor.submit(run_example_captured, str(example_file))
+            for example_file in example_files
+        }
+
+        for name, future in futures.items():
+            try:
+                success, output = future.result()
+                print(output, end="")
+            except Exception as e:
+                print(f"✗ Worker running {name} crashed: {e}")
+                success = False
+            results[name] = success
 
     # Print summary
     print(f"\n{'='*60}")
@@ -104,8 +157,7 @@ def run_interactive():
     """Run examples interactively"""
 
     examples_dir = Path(__file__).parent / "examples"
-    example_files = list(examples_dir.glob("*.py"))
-    example_files.sort()
+    example_files = find_example_files(examples_dir)
 
     print("\nInteractive Example Runner")
     print("=" * 30)
@@ -11,11 +11,35 @@ import os
 from pathlib import Path
 
 
+class CategoryResults:
+    """Pytest plugin that buckets test outcomes by test file"""
+
+    def __init__(self, categories_by_file):
+        self.categories_by_file = categories_by_file
+        self.failed = set()
+        self.ran = set()
+
+    def _category(self, report):
+        test_file = Path(report.nodeid.split("::")[0]).name
+        return self.categories_by_file.get(test_file)
+
+    def pytest_collectreport(self, report):
+        # A file that fails to import never produces test reports
+        if report.failed:
+            self.failed.add(self._category(report))
+
+    def pytest_runtest_logreport(self, report):
+        category = self._category(report)
+        self.ran.add(category)
+        if report.failed:
+            self.failed.add(category)
+
+
 def run_tests():
     """Run all tests and return results"""
 
     # Get the project root directory
-    project_root = Path(__file__).parent.parent
+    project_root = Path(__file__).parent
     tests_dir = project_root / "tests"
 
     print("Next.js Hydration Parser - Test Runner")
@@ -41,9 +65,9 @@ def run_tests():
 
     results = {}
     overall_success = True
+    categories_by_file = {}
 
     for category, test_file in test_files:
-        print(f"\n--- Running {category} ---")
         test_path = tests_dir / test_file
 
         if not test_path.exists():
@@ -51,29 +75,34 @@ def run_tests():
             results[category] = "MISSING"
             continue
 
-        try:
-            # Run pytest for this specific file
-            result = subprocess.run(
-                [sys.executable, "-m", "pytest", str(test_path), "-v", "--tb=short"],
-                capture_output=True,
-                text=True,
-                cwd=project_root,
-            )
-
-            if result.returncode == 0:
-                print(f"✓ {category}: PASSED")
-                results[category] = "PASSED"
-            else:
-                print(f"✗ {category}: FAILED")
-                print("STDOUT:", result.stdout[-500:])  # Last 500 chars
-                print("STDERR:", result.stderr[-500:])
-                results[category] = "FAILED"
-                overall_success = False
-
-        except Exception as e:
-            print(f"✗ {category}: ERROR - {e}")
-            results[category] = f"ERROR: {e}"
+        categories_by_file[test_file] = category
+
+    # Run every category in one in-process session so imports, plugin
+    # loading and conftest collection happen only once
+    collector = CategoryResults(categories_by_file)
+    test_paths = [str(tests_dir / test_file) for test_file in categories_by_file]
+
+    try:
+        exit_code = pytest.main(["-v", "--tb=short", *test_paths], plugins=[collector])
+    except Exception as e:
+        print(f"✗ ERROR running tests - {e}")
+        return False
+
+    # Collection errors, interruptions, etc. can stop the session before
+    # some categories run at all
+    session_completed = exit_code in (pytest.ExitCode.OK, pytest.ExitCode.TESTS_FAILED)
+    if not session_completed:
+        print(f"✗ pytest exited with status {exit_code}")
+        overall_success = False
+
+    for category in categories_by_file.values():
+        if category in collector.failed:
+            results[category] = "FAILED"
             overall_success = False
+        elif not session_completed and category not in collector.ran:
+            results[category] = "NOT RUN"
+        else:
+            results[category] = "PASSED"
 
     # Print summary
     print("\n" + "=" * 50)
@@ -108,24 +137,22 @@ def run_coverage():
         print("pip install coverage")
         return False
 
-    project_root = Path(__file__).parent.parent
+    import pytest
+
+    project_root = Path(__file__).parent
 
     # Run pytest with coverage
-    result = subprocess.run(
+    exit_code = pytest.main(
         [
-            sys.executable,
-            "-m",
-            "pytest",
             "--cov=nextjs_hydration_parser",
             "--cov-report=term-missing",
-            "--cov-report=html:htmlcov",
-            "tests/",
+            f"--cov-report=html:{project_root / 'htmlcov'}",
+            str(project_root / "tests"),
             "-v",
-        ],
-        cwd=project_root,
+        ]
     )
 
-    if result.returncode == 0:
+    if exit_code == pytest.ExitCode.OK:
         print("\n✓ Tests passed with coverage report generated")
         print("HTML coverage report: htmlcov/index.html")
         return True
@@ -146,7 +173,9 @@ def main():
         if success:
             response = input("\nRun with coverage report? (y/n): ").lower().strip()
             if response == "y":
-                run_coverage()
+                # The package is already imported in this process, which would
+                # hide its module-level lines from coverage; use a fresh one
+                subprocess.run([sys.executable, __file__, "--coverage"])
 
     # Print additional information
     print("\n" + "=" * 50)
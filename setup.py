@@ -39,6 +39,10 @@ setup(
         "chompjs>=1.2.0",
     ],
     extras_require={
+        "fast": [
+            "hyperscan>=0.4.0",
+            "pysimdjson>=5.0.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
@@ -68,33 +68,39 @@ ECOMMERCE_HTML = """
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_html():
     """Simple HTML with one chunk"""
     return SIMPLE_HTML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_html():
     """Complex HTML with various data types"""
     return COMPLEX_HTML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def malformed_html():
     """HTML with some malformed data"""
     return MALFORMED_HTML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ecommerce_html():
     """E-commerce style HTML"""
     return ECOMMERCE_HTML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def extractor():
-    """Create a fresh extractor instance"""
+    """Create an extractor instance shared by the whole session"""
     from nextjs_hydration_parser import NextJSHydrationDataExtractor
 
     return NextJSHydrationDataExtractor()
+
+
+@pytest.fixture(scope="session")
+def ecommerce_chunks(extractor, ecommerce_html):
+    """E-commerce HTML parsed once per session (treat as read-only)"""
+    return extractor.parse(ecommerce_html)
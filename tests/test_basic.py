@@ -15,6 +15,20 @@ class TestBasicFunctionality:
         assert hasattr(extractor, "script_pattern")
         assert extractor.script_pattern is not None
 
+    def test_custom_script_pattern(self):
+        """Test that overriding script_pattern changes what is scanned"""
+        html = """
+        <script>self.__next_f.push([1,"{\\"a\\": 1}"])</script>
+        <script>self.__other_f.push([2,"{\\"b\\": 2}"])</script>
+        """
+        extractor = NextJSHydrationDataExtractor()
+        extractor.script_pattern = r"self\.__other_f\.push\(\[(.*?)\]\)"
+
+        for content in (html, html.encode()):
+            chunks = extractor.parse(content)
+            assert [chunk["chunk_id"] for chunk in chunks] == [2]
+            assert chunks[0]["extracted_data"][0]["data"] == {"b": 2}
+
     def test_empty_html(self, extractor):
         """Test parsing empty HTML"""
         result = extractor.parse("")
@@ -65,6 +79,22 @@ class TestBasicFunctionality:
         assert result[0]["chunk_count"] == 2
         assert len(result[0]["_positions"]) == 2
 
+    def test_bytes_input(self, extractor, simple_html):
+        """Test that bytes input parses the same as str input"""
+        from_str = extractor.parse(simple_html)
+        from_bytes = extractor.parse(simple_html.encode("utf-8"))
+
+        assert len(from_bytes) == len(from_str)
+        assert from_bytes[0]["chunk_id"] == from_str[0]["chunk_id"]
+        assert from_bytes[0]["extracted_data"] == from_str[0]["extracted_data"]
+
+    def test_iter_parse(self, extractor, complex_html):
+        """Test that iter_parse lazily yields the same chunks as parse"""
+        chunks = extractor.iter_parse(complex_html)
+
+        assert not isinstance(chunks, list)
+        assert list(chunks) == extractor.parse(complex_html)
+
 
 class TestDataTypes:
     """Test parsing different data types"""
@@ -233,5 +233,75 @@ class TestBoundaryConditions:
         assert "another_id" in chunk_ids
 
 
+class TestScanners:
+    """Test that the optional scanners agree with the regex scanner"""
+
+    def test_hyperscan_matches_regex(self, extractor):
+        """Test Hyperscan push-call discovery against the regex path"""
+        from nextjs_hydration_parser import extractor as extractor_module
+
+        if extractor_module._HYPERSCAN_DB is None:
+            pytest.skip("hyperscan not installed")
+
+        html = b"""
+        <script>self.__next_f.push([1,"{\\"a\\": 1}"])</script>
+        <script>self.__next_f.push([2</script>
+        <script>self.__next_f.push([3,"self.__next_f.push([4,\\"x\\"])"])</script>
+        <script>self.__next_f.push(["id","caf\xc3\xa9"])</script>
+        <script>self.__next_f.push([5,"unterminated
+        """
+
+        expected = [
+            (match.start(), match.group(1).decode("utf-8"))
+            for match in extractor_module._SCRIPT_RE_BYTES.finditer(html)
+        ]
+        assert list(extractor._iter_hyperscan_matches(html)) == expected
+
+    def test_parse_bytes_from_several_threads(self, complex_html):
+        """Test that concurrent byte scans don't share scanner state"""
+        from concurrent.futures import ThreadPoolExecutor
+        from nextjs_hydration_parser import NextJSHydrationDataExtractor
+
+        html = (complex_html * 50).encode()
+        expected = NextJSHydrationDataExtractor().parse(html)
+
+        def parse_in_thread(_):
+            return NextJSHydrationDataExtractor().parse(html)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(parse_in_thread, range(32)))
+
+        assert all(result == expected for result in results)
+
+
+class TestJSONDecoding:
+    """Test the strict JSON fast path"""
+
+    def test_json_decoding_matches_stdlib(self, extractor, monkeypatch):
+        """Test that parsing gives the same result with and without simdjson"""
+        from nextjs_hydration_parser import extractor as extractor_module
+
+        text = '{"name": "caf\\u00e9", "values": [1, 2.5, null, true]}'
+        accelerated = extractor._parse_js_object(text)
+
+        monkeypatch.setattr(extractor_module, "simdjson", None)
+        assert extractor._parse_js_object(text) == accelerated == json.loads(text)
+
+    def test_non_strict_json_values(self, extractor):
+        """Test values simdjson rejects still decode like json.loads"""
+        result = extractor._parse_js_object('{"value": NaN}')
+
+        assert result["value"] != result["value"]
+
+    def test_big_integers(self, extractor):
+        """Test integers outside the 64-bit range decode like json.loads"""
+        from nextjs_hydration_parser import extractor as extractor_module
+
+        text = '{"low": -9223372036854775809, "id": 123456789012345678901234567890}'
+
+        assert extractor_module._loads_json(text) == json.loads(text)
+        assert extractor._parse_js_object(text) == json.loads(text)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,6 +4,38 @@ Integration tests for real-world scenarios
 
 import pytest
 import json
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+
+def load_example(name):
+    """Import an example script as a module without running its main()"""
+    spec = importlib.util.spec_from_file_location(name, EXAMPLES_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def numpy_or_stub():
+    """Return NumPy, or a stand-in for the calls analyze_products makes"""
+    try:
+        import numpy
+
+        return numpy
+    except ImportError:
+
+        def frombuffer(buffer, dtype):
+            values = memoryview(buffer).tolist()
+            return SimpleNamespace(
+                min=lambda: min(values),
+                max=lambda: max(values),
+                mean=lambda: sum(values) / len(values),
+            )
+
+        return SimpleNamespace(float64="float64", frombuffer=frombuffer)
 
 
 class TestEcommerceScenarios:
@@ -286,5 +318,47 @@ class TestRealWorldComplexity:
         assert len(big_object) >= 1
 
 
+class TestExampleScripts:
+    """Test code paths in the example scripts that the demos don't reach"""
+
+    def test_numpy_price_stats_match_scalar_path(self, monkeypatch, capsys):
+        """Test large catalogs give the same stats via NumPy and array"""
+        ecommerce = load_example("ecommerce_scraping")
+        products = [
+            {
+                "id": i,
+                "price": 10 + (i % 97) * 0.25,
+                "inStock": i % 3 == 0,
+                "brand": f"Brand {i % 4}",
+                "category": "electronics",
+            }
+            for i in range(ecommerce.NUMPY_MIN_PRODUCTS + 44)
+        ]
+        products.append({"id": "no-price", "inStock": True})
+        product_data = {"products": products}
+
+        monkeypatch.setattr(ecommerce, "np", None)
+        ecommerce.analyze_products(product_data)
+        scalar_output = capsys.readouterr().out
+
+        np_module = numpy_or_stub()
+        buffer_sizes = []
+
+        def frombuffer(buffer, dtype):
+            buffer_sizes.append(len(buffer))
+            return np_module.frombuffer(buffer, dtype=dtype)
+
+        monkeypatch.setattr(
+            ecommerce,
+            "np",
+            SimpleNamespace(float64=np_module.float64, frombuffer=frombuffer),
+        )
+        ecommerce.analyze_products(product_data)
+
+        assert buffer_sizes == [len(products) - 1]
+        assert capsys.readouterr().out == scalar_output
+        assert "Price range: $10.00 - $34.00" in scalar_output
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
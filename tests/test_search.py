@@ -2,6 +2,9 @@
 Tests for search and analysis functionality
 """
 
+import json
+import re
+
 import pytest
 
 
@@ -72,9 +75,9 @@ class TestKeyExtraction:
 class TestPatternSearch:
     """Test pattern search functionality"""
 
-    def test_find_data_by_pattern_simple(self, extractor, ecommerce_html):
+    def test_find_data_by_pattern_simple(self, extractor, ecommerce_chunks):
         """Test finding data by simple pattern"""
-        chunks = extractor.parse(ecommerce_html)
+        chunks = ecommerce_chunks
 
         # Search for products
         products = extractor.find_data_by_pattern(chunks, "product")
@@ -121,9 +124,9 @@ class TestPatternSearch:
         results = extractor.find_data_by_pattern(chunks, "nonexistent_pattern")
         assert results == []
 
-    def test_find_data_by_pattern_structure(self, extractor, ecommerce_html):
+    def test_find_data_by_pattern_structure(self, extractor, ecommerce_chunks):
         """Test structure of pattern search results"""
-        chunks = extractor.parse(ecommerce_html)
+        chunks = ecommerce_chunks
         results = extractor.find_data_by_pattern(chunks, "product")
 
         if results:  # If we found any results
@@ -134,13 +137,97 @@ class TestPatternSearch:
                 if "path" in result:
                     assert isinstance(result["path"], str)
 
+    def test_find_data_by_patterns(self, extractor, ecommerce_chunks):
+        """Test batch search matches individual searches"""
+        chunks = ecommerce_chunks
+        patterns = ["product", "cart", "name", "nonexistent_pattern"]
+
+        results = extractor.find_data_by_patterns(chunks, patterns)
+
+        assert list(results.keys()) == patterns
+        for pattern in patterns:
+            assert results[pattern] == extractor.find_data_by_pattern(chunks, pattern)
+        assert results["nonexistent_pattern"] == []
+
+    def test_find_data_by_compiled_pattern(
+        self, extractor, ecommerce_html, ecommerce_chunks
+    ):
+        """Test searching with precompiled regular expressions"""
+        chunks = ecommerce_chunks
+        exact_name = re.compile(r"^name$")
+        product = re.compile("product", re.IGNORECASE)
+
+        results = extractor.find_data_by_patterns(chunks, [exact_name, product, "id"])
+
+        assert {match["key"] for match in results[exact_name]} == {"name"}
+        assert results[product] == extractor.find_data_by_pattern(chunks, "product")
+        assert {match["key"] for match in results["id"]} == {"id", "productId"}
+        assert extractor.find_data_in_html(ecommerce_html, [exact_name]) == {
+            exact_name: results[exact_name]
+        }
+
+    def test_find_data_in_html(self, extractor, ecommerce_html, ecommerce_chunks):
+        """Test searching HTML directly matches parse + batch search"""
+        patterns = ["product", "CART", "name", "nonexistent_pattern"]
+
+        results = extractor.find_data_in_html(ecommerce_html, patterns)
+
+        assert results == extractor.find_data_by_patterns(ecommerce_chunks, patterns)
+        assert len(results["CART"]) >= 1
+
+    def test_find_data_in_html_skips_unrelated_chunks(self, extractor, monkeypatch):
+        """Test that chunks without any pattern are never extracted"""
+        html = """
+        <script>self.__next_f.push([1,"{\\"price\\": 10}"])</script>
+        <script>self.__next_f.push([2,"{\\"unrelated\\": true}"])</script>
+        <script>self.__next_f.push([3,"{\\"items\\": ["])</script>
+        <script>self.__next_f.push([3,"{\\"price\\": 20}]}"])</script>
+        """
+
+        extracted_texts = []
+        original = extractor._extract_all_data_structures
+
+        def tracking_extract(text):
+            extracted_texts.append(text)
+            return original(text)
+
+        monkeypatch.setattr(extractor, "_extract_all_data_structures", tracking_extract)
+
+        results = extractor.find_data_in_html(html, ["price"])
+
+        assert [match["value"] for match in results["price"]] == [10, 20]
+        assert len(extracted_texts) == 2
+        assert not any("unrelated" in text for text in extracted_texts)
+
+    def test_find_data_in_html_escaped_keys(self, extractor):
+        """Test that keys written with JSON escapes are not filtered out"""
+        payloads = [
+            '{"a\\/price": 1}',
+            '{"tab\\tprice": 2}',
+            '{"\\u0041price": 3}',
+            '{"back\\\\price": 4}',
+        ]
+        html = "".join(
+            f"<script>self.__next_f.push([{i},{json.dumps(payload)}])</script>"
+            for i, payload in enumerate(payloads, 1)
+        )
+        chunks = extractor.parse(html)
+
+        # Each pattern only appears in its payload once the escapes are decoded
+        for value, pattern in enumerate(
+            ["a/price", "tab\tprice", "aprice", "back\\price"], 1
+        ):
+            results = extractor.find_data_in_html(html, [pattern])
+            assert results == extractor.find_data_by_patterns(chunks, [pattern])
+            assert [match["value"] for match in results[pattern]] == [value]
+
 
 class TestDataAnalysis:
     """Test data analysis features"""
 
-    def test_analyze_ecommerce_data(self, extractor, ecommerce_html):
+    def test_analyze_ecommerce_data(self, extractor, ecommerce_chunks):
         """Test analysis of e-commerce data"""
-        chunks = extractor.parse(ecommerce_html)
+        chunks = ecommerce_chunks
 
         # Should be able to extract meaningful data
         assert len(chunks) >= 3